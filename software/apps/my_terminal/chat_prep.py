@@ -7,23 +7,18 @@ def split_file(input_file, output_file, chunk_size=4000):
             print(f"Error: The file '{input_file}' does not exist in the current directory.")
             return
         
-        # Read the content of the input file
-        with open(input_file, 'r') as infile:
-            content = infile.read()
+        num_parts = 0
 
-        # Calculate how many parts we will have
-        num_parts = len(content) // chunk_size + (1 if len(content) % chunk_size > 0 else 0)
-
-        # Write the chunks into the output file
-        with open(output_file, 'w') as outfile:
-            for part_num in range(num_parts):
-                # Get the current chunk
-                start = part_num * chunk_size
-                end = start + chunk_size
-                chunk = content[start:end]
+        # Stream the file one chunk at a time instead of loading it all into memory
+        with open(input_file, 'r') as infile, open(output_file, 'w') as outfile:
+            while True:
+                chunk = infile.read(chunk_size)
+                if not chunk:
+                    break
+                num_parts += 1
 
                 # Write part label and chunk to the output file
-                outfile.write(f"Part {part_num + 1}\n")
+                outfile.write(f"Part {num_parts}\n")
                 outfile.write(chunk)
                 outfile.write("\n\n")  # Separate parts with extra newlines
 
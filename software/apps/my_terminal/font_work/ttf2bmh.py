@@ -51,14 +51,18 @@ import re
 import os
 import sys
 import subprocess
+from multiprocessing import Pool
 from shutil import copyfile
 from fontTools.ttLib import TTFont
 import unicodedata
 from PIL import Image, ImageFont, ImageDraw
+import numpy as np
 import argparse
 
 VERSION = '2.1'
 
+CP437_CHARS = bytes(range(256)).decode('cp437')
+
 def is_printable(char):
     """Exclude control and invisible characters."""
     category = unicodedata.category(char)
@@ -79,29 +83,62 @@ def render_char(char, font, size, yoffset=0):
     draw.text((0, -yoffset), char, font=font)
     return image
 
-def write_header(chars, font, size, yoffset=0, header_file="font.h"):
+def extract_glyph_bytes(image):
+    """Pack a rendered glyph image into one byte per 8-pixel scanline."""
+    mask = (np.asarray(image, dtype=np.uint8) == 0).astype(np.uint8)
+    return np.packbits(mask, axis=1)[:, 0]
+
+def _extract_chunk(args):
+    """Worker: render one chunk of characters with a private copy of the font."""
+    font_path, font_size, size, yoffset, chunk = args
+    font = ImageFont.truetype(font_path, font_size)
+    return [extract_glyph_bytes(render_char(char, font, size, yoffset)) for char in chunk]
+
+def build_font_data(chars, font_path, font_size, size, yoffset=0):
+    """Render every character exactly once into one contiguous (chars, rows) array.
+
+    Glyphs are independent, so chunks of 64 are rendered in parallel across
+    cores. PIL font objects do not pickle, so each worker loads its own.
+    """
+    chunk_len = 64
+    jobs = [(font_path, font_size, size, yoffset, chars[i:i + chunk_len])
+            for i in range(0, len(chars), chunk_len)]
+    with Pool() as pool:
+        results = pool.map(_extract_chunk, jobs)
+
+    font_data = np.empty((len(chars), size[1]), dtype=np.uint8)
+    i = 0
+    for chunk_rows in results:
+        for data in chunk_rows:
+            font_data[i] = data
+            i += 1
+    return font_data
+
+def write_header(chars, font_data, header_file="font.h"):
+    lines = []
+    lines.append("#ifndef FONT_8X16_H\n")
+    lines.append("#define FONT_8X16_H\n\n")
+    lines.append(f"// Font: PxPlus IBM VGA 8x16\n")
+    lines.append(f"// Total characters: {len(chars)}\n\n")
+    lines.append(f"static const uint8_t font_8x16[256][16] = {{\n")
+    # One C-level hex() call formats the whole glyph table; rows are sliced out.
+    digits = font_data.shape[1] * 2
+    hex_all = font_data.tobytes().hex().upper()
+    for idx, char in enumerate(chars):
+        row_hex = hex_all[idx * digits:(idx + 1) * digits]
+        byte_line = ", ".join("0x" + row_hex[j:j + 2] for j in range(0, digits, 2))
+        lines.append(f"  /* {idx:3} */ {{ {byte_line} }}, // Index {idx}: '{repr(char)}'\n")
+    lines.append("};\n")
+    lines.append("#endif\n")
     with open(header_file, "w") as f:
-        f.write("#ifndef FONT_8X16_H\n")
-        f.write("#define FONT_8X16_H\n\n")
-        f.write(f"// Font: PxPlus IBM VGA 8x16\n")
-        f.write(f"// Total characters: {len(chars)}\n\n")
-        f.write(f"static const uint8_t font_8x16[256][16] = {{\n")
-        for idx, char in enumerate(chars):
-            image = render_char(char, font, size, yoffset)
-            pixels = list(image.getdata())
-            bytestr = []
-            for y in range(size[1]):
-                byte = 0
-                for x in range(size[0]):
-                    if pixels[y * size[0] + x] == 0:
-                        byte |= (1 << (7 - x))
-                bytestr.append(f"0x{byte:02X}")
-            byte_line = ", ".join(bytestr)
-            f.write(f"  /* {idx:3} */ {{ {byte_line} }}, // Index {idx}: '{repr(char)}'\n")
-        f.write("};\n")
-        f.write("#endif\n")
-
-def create_preview(chars, font, size, yoffset=0, preview_image="preview.png"):
+        f.write("".join(lines))
+
+def glyph_strip(font_data, size):
+    """Decode every glyph's packed scanline bytes with one C-level frombytes call."""
+    strip = Image.frombytes('1', (size[0], len(font_data) * size[1]), font_data.tobytes())
+    return strip.convert('L').point(lambda v: 255 - v).convert('RGB')
+
+def create_preview(chars, font_data, size, preview_image="preview.png"):
     from PIL import ImageFont, ImageDraw, Image
 
     printable_chars = [(idx, char) for idx, char in enumerate(chars) if is_printable(char)]
@@ -123,12 +160,13 @@ def create_preview(chars, font, size, yoffset=0, preview_image="preview.png"):
     canvas_width = columns * (char_width + spacing)
     canvas_height = rows * (char_height + spacing)
 
-    preview = Image.new('RGB', (canvas_width, canvas_height), color=(255, 255, 255))
-    draw = ImageDraw.Draw(preview)
+    # Assemble boxes and glyphs with numpy slice writes; only the label text
+    # still needs ImageDraw on the finished canvas.
+    canvas = np.full((canvas_height, canvas_width, 3), 255, dtype=np.uint8)
+    glyphs = np.asarray(glyph_strip(font_data, size))
+    labels = []
 
     for i, (idx, char) in enumerate(printable_chars):
-        img = render_char(char, font, size, yoffset)
-
         label = str(idx)
         col = i % columns
         row = i // columns
@@ -136,16 +174,25 @@ def create_preview(chars, font, size, yoffset=0, preview_image="preview.png"):
         x = col * (char_width + spacing)
         y = row * (char_height + spacing)
 
-        draw.rectangle([x, y, x + char_width, y + size[1] + box_padding * 2], outline=(0, 0, 0))
+        box_bottom = y + size[1] + box_padding * 2
+        canvas[y, x:x + char_width + 1] = 0
+        canvas[box_bottom, x:x + char_width + 1] = 0
+        canvas[y:box_bottom + 1, x] = 0
+        canvas[y:box_bottom + 1, x + char_width] = 0
 
         char_x = x + (char_width - size[0]) // 2
         char_y = y + box_padding
-        preview.paste(img.convert('RGB'), (char_x, char_y))
+        canvas[char_y:char_y + size[1], char_x:char_x + size[0]] = \
+            glyphs[idx * size[1]:(idx + 1) * size[1]]
+
+        labels.append((x, box_bottom, label))
 
+    preview = Image.fromarray(canvas, 'RGB')
+    draw = ImageDraw.Draw(preview)
+    for x, label_y, label in labels:
         label_bbox = label_font.getbbox(label)
         label_width = label_bbox[2] - label_bbox[0]
         label_x = x + (char_width - label_width) // 2
-        label_y = y + size[1] + box_padding * 2
         draw.text((label_x, label_y), label, font=label_font, fill=(0, 0, 0))
 
     preview.save(preview_image)
@@ -156,6 +203,7 @@ def main():
     parser.add_argument('-f', '--font', dest='font_path', required=True, help='Path to the TTF font file.')
     parser.add_argument('-s', '--size', dest='font_size', type=int, default=16, help='Font size.')
     parser.add_argument('--all-glyphs', action='store_true', help='Extract all glyphs from the font. Default is to use code page 437.')
+    parser.add_argument('--no-preview', action='store_true', help='Skip the preview image and only write the header file.')
     args = parser.parse_args()
 
     font_path = args.font_path
@@ -174,21 +222,24 @@ def main():
         chars = get_all_chars(tt)
     else:
         print("Using code page 437...")
-        chars = bytes(range(256)).decode('cp437')
+        chars = CP437_CHARS
 
 
     print(f"Total characters found: {len(chars)}")
 
-    PILfont = ImageFont.truetype(font_path, font_size)
     size = (8, 16)
     yoffset = 0
 
     print("Writing header file...")
-    write_header(chars, PILfont, size, yoffset, header_file)
+    font_data = build_font_data(chars, font_path, font_size, size, yoffset)
+    write_header(chars, font_data, header_file)
     print(f"{header_file} written")
 
-    print("Creating preview...")
-    create_preview(chars, PILfont, size, yoffset, preview_image)
+    if args.no_preview:
+        print("Skipping preview...")
+    else:
+        print("Creating preview...")
+        create_preview(chars, font_data, size, preview_image)
 
     print("TTF2BMH Finished")
 